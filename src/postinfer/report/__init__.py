@@ -1 +1,3 @@
 from .pdg import round_pdg as round_pdg
+from .pipeline import run_pipeline as run_pipeline
+from .summary import Summary as Summary
@@ -56,6 +56,69 @@ def round_err_pdg(err: float) -> tuple[float, int]:
     return err, exp10 - precision
 
 
+def _round_pdg_parts(
+    value: float,
+    err: float,
+    err2: float | None,
+    exp10: int | None,
+    no_sci_nota_exp10_range: tuple[int, int],
+    force_asymmetric: bool,
+) -> tuple[float, float, float | None, int, int]:
+    """Apply the PDG rounding rules without formatting the result.
+
+    See :func:`round_pdg` for the description of the parameters.
+
+    Returns
+    -------
+    float, float, float or None, int, int
+        The value, the rounded error(s), the exponent of last precise digit,
+        and the exponent to display. The second error is ``None`` if the
+        result is displayed as symmetric.
+    """
+    value = float(value)
+    err = float(err)
+    if err2 is None:
+        if err < 0.0:
+            raise ValueError('error must be positive')
+        err, precision_exp10 = round_err_pdg(err)
+    else:
+        err2 = float(err2)
+        if err > 0.0:
+            raise ValueError('lower error must be negative')
+        if err2 < 0.0:
+            raise ValueError('upper error must be positive')
+
+        err_abs = abs(err)
+        err_diff = abs(err_abs - err2)
+        err_avg = 0.5 * (err_abs + err2)
+
+        if not force_asymmetric and err_diff <= 0.1 * err_avg:
+            err2 = None
+            err, precision_exp10 = round_err_pdg(err_avg)
+        else:
+            err, precision_exp10 = round_err_pdg(err_abs)
+            err2_ = err2
+            err2, precision2_exp10 = round_err_pdg(err2)
+            if err2_ < err_abs:
+                precision_exp10 = precision2_exp10
+
+    if exp10 is None:
+        exp10 = max(exp_of_first_sigfig(value), precision_exp10)
+        if no_sci_nota_exp10_range[0] <= exp10 <= no_sci_nota_exp10_range[1]:
+            # Only set exp10=0 if it doesn't violate the precision constraint
+            exp10 = 0 if precision_exp10 <= 0 else exp10
+    else:
+        if exp10 < precision_exp10:
+            warnings.warn(
+                f'for {value=}, {err=} and {err2=}, {exp10=} is clipped to '
+                f'the error precision ({precision_exp10})',
+                Warning,
+            )
+        exp10 = max(int(exp10), precision_exp10)
+
+    return value, err, err2, precision_exp10, exp10
+
+
 def round_pdg(
     value: float,
     err: float,
@@ -112,52 +175,9 @@ def round_pdg(
     ----------
     .. [1] https://pdg.lbl.gov/2024/reviews/rpp2024-rev-rpp-intro.pdf
     """
-    value = float(value)
-    err = float(err)
-    if err2 is None:
-        if err < 0.0:
-            raise ValueError('error must be positive')
-        err, precision_exp10 = round_err_pdg(err)
-    else:
-        err2 = float(err2)
-        if err > 0.0:
-            raise ValueError('lower error must be negative')
-        if err2 < 0.0:
-            raise ValueError('upper error must be positive')
-
-        err_abs = abs(err)
-
-        if not force_asymmetric:
-            err_diff = abs(err_abs - err2)
-            err_avg = 0.5 * (err_abs + err2)
-
-            if err_diff <= 0.1 * err_avg:
-                return round_pdg(
-                    value,
-                    err_avg,
-                    exp10=exp10,
-                    no_sci_nota_exp10_range=no_sci_nota_exp10_range,
-                )
-
-        err, precision_exp10 = round_err_pdg(err_abs)
-        err2_ = err2
-        err2, precision2_exp10 = round_err_pdg(err2)
-        if err2_ < err_abs:
-            precision_exp10 = precision2_exp10
-
-    if exp10 is None:
-        exp10 = max(exp_of_first_sigfig(value), precision_exp10)
-        if no_sci_nota_exp10_range[0] <= exp10 <= no_sci_nota_exp10_range[1]:
-            # Only set exp10=0 if it doesn't violate the precision constraint
-            exp10 = 0 if precision_exp10 <= 0 else exp10
-    else:
-        if exp10 < precision_exp10:
-            warnings.warn(
-                f'for {value=}, {err=} and {err2=}, {exp10=} is clipped to '
-                f'the error precision ({precision_exp10})',
-                Warning,
-            )
-        exp10 = max(int(exp10), precision_exp10)
+    value, err, err2, precision_exp10, exp10 = _round_pdg_parts(
+        value, err, err2, exp10, no_sci_nota_exp10_range, force_asymmetric
+    )
 
     f = 10.0**-exp10 if exp10 >= 0 else 1.0 / 10.0**exp10
     p = exp10 - precision_exp10
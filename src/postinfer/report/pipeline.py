@@ -0,0 +1,158 @@
+import asyncio
+import collections
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor
+from typing import Any
+
+from .summary import Summary
+
+_DONE = object()
+
+
+def _summarize_and_render(
+    summarize: Callable[[Any], Any],
+    render: Callable[[Any], str],
+    data: Any,
+) -> str:
+    return render(summarize(data))
+
+
+def _next_and_load(
+    sources: Iterator[Any],
+    load: Callable[[Any], Any],
+) -> Any:
+    source = next(sources, _DONE)
+    if source is _DONE:
+        return _DONE
+    return source, load(source)
+
+
+async def _load_stage(
+    sources: Iterable[Any],
+    load: Callable[[Any], Any],
+    queue: asyncio.Queue,
+) -> None:
+    loop = asyncio.get_running_loop()
+    # iterate sources in the executor as well, in case it does I/O lazily
+    sources = await loop.run_in_executor(None, iter, sources)
+    while (
+        item := await loop.run_in_executor(None, _next_and_load, sources, load)
+    ) is not _DONE:
+        await queue.put(item)
+    await queue.put(_DONE)
+
+
+async def _compute_stage(
+    summarize: Callable[[Any], Any],
+    render: Callable[[Any], str],
+    executor: Executor | None,
+    concurrency: int,
+    in_queue: asyncio.Queue,
+    out_queue: asyncio.Queue,
+) -> None:
+    loop = asyncio.get_running_loop()
+    pending = collections.deque()
+    try:
+        while (item := await in_queue.get()) is not _DONE:
+            source, data = item
+            future = loop.run_in_executor(
+                executor, _summarize_and_render, summarize, render, data
+            )
+            pending.append((source, future))
+            if len(pending) >= concurrency:
+                source, future = pending.popleft()
+                await out_queue.put((source, await future))
+        while pending:
+            source, future = pending.popleft()
+            await out_queue.put((source, await future))
+    finally:
+        for _, future in pending:
+            future.cancel()
+    await out_queue.put(_DONE)
+
+
+async def _write_stage(
+    write: Callable[[Any, str], Any],
+    queue: asyncio.Queue,
+) -> None:
+    loop = asyncio.get_running_loop()
+    while (item := await queue.get()) is not _DONE:
+        await loop.run_in_executor(None, write, *item)
+
+
+async def run_pipeline(
+    sources: Iterable[Any],
+    load: Callable[[Any], Any],
+    summarize: Callable[[Any], Any],
+    write: Callable[[Any, str], Any],
+    render: Callable[[Any], str] = Summary.table,
+    executor: Executor | None = None,
+    concurrency: int = 1,
+    maxsize: int = 1,
+) -> None:
+    """Load, summarize, render and write reports concurrently.
+
+    The pipeline consists of three stages connected by bounded queues:
+
+    * ``load(source)`` is called in the default executor of the event loop,
+      so is the iteration over `sources`,
+    * ``render(summarize(data))`` is called in `executor`, with up to
+      `concurrency` calls in flight,
+    * ``write(source, text)`` is called in the default executor.
+
+    While sources are being summarized, the next one is loaded and the
+    previous ones are written, so the throughput is limited by the slowest
+    stage rather than their sum. The sources are written in the input order.
+
+    Parameters
+    ----------
+    sources : iterable
+        The sources to process, e.g. chain file paths, or chunks of them.
+    load : callable
+        The function to read the samples of a source.
+    summarize : callable
+        The function to summarize the loaded samples, e.g. returning a
+        :class:`Summary`.
+    write : callable
+        The function to write the rendered text of a source.
+    render : callable, optional
+        The function to render the result of `summarize`.
+        The default is :meth:`Summary.table`.
+    executor : concurrent.futures.Executor, optional
+        The executor to run `summarize` and `render`. If the computation
+        is CPU-bound, a :class:`~concurrent.futures.ProcessPoolExecutor`
+        avoids contention on the GIL, in which case the functions and the
+        loaded samples must be picklable. The default executor of the event
+        loop is used if not provided.
+    concurrency : int, optional
+        The maximum number of sources summarized at the same time. Set it to
+        the number of workers of `executor` to use all of them. The default
+        is 1, i.e., sources are summarized one after another.
+    maxsize : int, optional
+        The capacity of the queues between stages. It bounds the number of
+        loaded sources waiting to be summarized, and of rendered texts
+        waiting to be written. The default is 1.
+    """
+    if maxsize < 1:
+        raise ValueError('maxsize must be positive')
+    if concurrency < 1:
+        raise ValueError('concurrency must be positive')
+
+    loaded = asyncio.Queue(maxsize)
+    rendered = asyncio.Queue(maxsize)
+    tasks = [
+        asyncio.ensure_future(_load_stage(sources, load, loaded)),
+        asyncio.ensure_future(
+            _compute_stage(
+                summarize, render, executor, concurrency, loaded, rendered
+            )
+        ),
+        asyncio.ensure_future(_write_stage(write, rendered)),
+    ]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
@@ -0,0 +1,469 @@
+import argparse
+import asyncio
+import collections
+import functools
+import ipaddress
+import json
+import os
+import socket
+import threading
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from .pdg import round_pdg
+from .summary import Summary
+
+_STREAM_LIMIT = 2**24
+
+
+def _cache_key(kwargs: dict) -> str:
+    # canonical JSON keeps values like 1, 1.0 and true apart in the cache
+    return json.dumps(kwargs, sort_keys=True)
+
+
+def _round_pdg_item(key: str) -> str:
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        return round_pdg(**json.loads(key))
+
+
+def _summary_item(key: str) -> str | list[str]:
+    kwargs = json.loads(key)
+    fmt = kwargs.pop('fmt', 'render')
+    summary = Summary.from_arrays(**kwargs)
+    if fmt == 'render':
+        return summary.render()
+    return summary.table(fmt)
+
+
+def _latency_stats(latency: list[float]) -> dict[str, float | None]:
+    latency = sorted(latency)
+    n = len(latency)
+    if not n:
+        return dict.fromkeys(('mean', 'p50', 'p90', 'p99', 'max'))
+    return {
+        'mean': sum(latency) / n,
+        'p50': latency[int(0.50 * (n - 1))],
+        'p90': latency[int(0.90 * (n - 1))],
+        'p99': latency[int(0.99 * (n - 1))],
+        'max': latency[-1],
+    }
+
+
+def _check_host(host: str) -> None:
+    if host == 'localhost':
+        return
+    try:
+        loopback = ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        loopback = False
+    if not loopback:
+        raise ValueError(f'host must be a loopback address, got {host!r}')
+
+
+class ServerError(RuntimeError):
+    """Error raised by the server while handling a request."""
+
+
+class ReportServer:
+    """Local server of :func:`round_pdg` and :class:`Summary` formatting.
+
+    The server listens on a Unix socket or a loopback TCP address, and
+    speaks newline-delimited JSON. Each request is an object of the form
+    ``{"method": ..., "params": [...]}``, where ``params`` is a batch of
+    keyword arguments, and each response is ``{"result": [...]}`` in the
+    same order, or ``{"error": ...}`` if any item of the batch fails.
+    The methods are:
+
+    * ``round_pdg``: keyword arguments of :func:`round_pdg`,
+    * ``summary``: keyword arguments of :meth:`Summary.from_arrays` and an
+      optional ``fmt``, which is ``'render'`` (the default), ``'markdown'``
+      or ``'latex'``,
+    * ``stats``: no parameters, returns :meth:`stats`.
+
+    Results are cached in LRU caches, so repeated requests are served
+    without recomputation as long as the server is alive. Clients are
+    served concurrently by the event loop, while the requests are computed
+    one at a time in a worker thread, which keeps the caches consistent and
+    the event loop responsive during large batches. The server can be run
+    from the command line with ``python -m postinfer.report.server``.
+
+    Parameters
+    ----------
+    path : str or path-like, optional
+        The Unix socket path to listen on. If not provided, listen on
+        `host` and `port` instead.
+    host : str, optional
+        The loopback address to listen on. The default is ``'127.0.0.1'``.
+    port : int, optional
+        The TCP port to listen on. The default is 0, i.e., a free port
+        chosen by the system, see :attr:`address`.
+    cache_size : int, optional
+        The maximum number of cached results of each method.
+        The default is 65536.
+    latency_window : int, optional
+        The number of most recent requests used for latency statistics.
+        The default is 10000.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike | None = None,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        cache_size: int = 65536,
+        latency_window: int = 10000,
+    ):
+        if path is None:
+            _check_host(host)
+        self._path = None if path is None else os.fspath(path)
+        self._host = host
+        self._port = int(port)
+        self._server = None
+        self._executor = None
+        self._handlers = set()
+        self._methods = {
+            'round_pdg': functools.lru_cache(cache_size)(_round_pdg_item),
+            'summary': functools.lru_cache(cache_size)(_summary_item),
+        }
+        self._lock = threading.Lock()
+        self._latency = collections.deque(maxlen=latency_window)
+        self._service_time = collections.deque(maxlen=latency_window)
+        self._start_time = time.monotonic()
+        self._open_connections = 0
+        self._total_connections = 0
+        self._requests = 0
+        self._items = 0
+        self._errors = 0
+
+    @property
+    def address(self) -> str | tuple[str, int]:
+        """The socket path, or the host and port the server listens on."""
+        if self._server is None:
+            raise RuntimeError('server is not started')
+        return self._server.sockets[0].getsockname()
+
+    async def start(self) -> None:
+        """Start listening for clients."""
+        if self._server is not None:
+            raise RuntimeError('server is already started')
+        self._executor = ThreadPoolExecutor(
+            1, thread_name_prefix='postinfer-report-server'
+        )
+        if self._path is not None:
+            self._server = await asyncio.start_unix_server(
+                self._handle, self._path, limit=_STREAM_LIMIT
+            )
+        else:
+            self._server = await asyncio.start_server(
+                self._handle, self._host, self._port, limit=_STREAM_LIMIT
+            )
+        self._start_time = time.monotonic()
+
+    async def serve_forever(self) -> None:
+        """Start the server if needed and serve until cancelled."""
+        if self._server is None:
+            await self.start()
+        try:
+            # asyncio.Server.serve_forever would wait for connected clients
+            # to leave when cancelled, so wait here and let close drop them
+            await asyncio.get_running_loop().create_future()
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        """Stop the server, disconnect the clients and remove the socket."""
+        if self._server is None:
+            return
+        server = self._server
+        self._server = None
+        server.close()
+        # Server.wait_closed waits for all connections since Python 3.12.1
+        for task in self._handlers:
+            task.cancel()
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+        await server.wait_closed()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+        if self._path is not None and os.path.exists(self._path):
+            os.unlink(self._path)
+
+    def stats(self) -> dict[str, Any]:
+        """Get the latency, throughput and cache statistics.
+
+        Returns
+        -------
+        dict
+            The statistics, with time in seconds. ``latency`` is measured
+            from receiving a request to sending its response, including the
+            time waiting behind requests of other clients, while
+            ``service_time`` is the time spent computing the response only.
+            ``open_connections`` is the number of currently connected
+            clients, and ``total_connections`` counts all clients since the
+            server started.
+        """
+        uptime = time.monotonic() - self._start_time
+        with self._lock:
+            latency = list(self._latency)
+            service_time = list(self._service_time)
+        cache_stats = {}
+        for name, method in self._methods.items():
+            info = method.cache_info()
+            cache_stats[name] = {
+                'hits': info.hits,
+                'misses': info.misses,
+                'size': info.currsize,
+            }
+        return {
+            'uptime': uptime,
+            'open_connections': self._open_connections,
+            'total_connections': self._total_connections,
+            'requests': self._requests,
+            'items': self._items,
+            'errors': self._errors,
+            'requests_per_second': self._requests / uptime,
+            'items_per_second': self._items / uptime,
+            'latency': _latency_stats(latency),
+            'service_time': _latency_stats(service_time),
+            'cache': cache_stats,
+        }
+
+    def _dispatch(self, request: Any) -> Any:
+        if not isinstance(request, dict):
+            raise ValueError('request must be a JSON object')
+        method = request.get('method')
+        params = request.get('params', [])
+        if method == 'stats':
+            return self.stats()
+        if method not in self._methods:
+            raise ValueError(f'unknown method {method!r}')
+        if not isinstance(params, list) or not all(
+            isinstance(i, dict) for i in params
+        ):
+            raise ValueError('params must be a list of JSON objects')
+        func = self._methods[method]
+        result = [func(_cache_key(kwargs)) for kwargs in params]
+        self._items += len(params)
+        return result
+
+    def _respond(self, line: bytes) -> bytes:
+        start = time.perf_counter()
+        try:
+            response = {'result': self._dispatch(json.loads(line))}
+        except Exception as e:
+            self._errors += 1
+            response = {'error': f'{type(e).__name__}: {e}'}
+        data = json.dumps(response).encode() + b'\n'
+        self._requests += 1
+        with self._lock:
+            self._service_time.append(time.perf_counter() - start)
+        return data
+
+    async def _handle(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        task = asyncio.current_task()
+        self._handlers.add(task)
+        self._open_connections += 1
+        self._total_connections += 1
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    self._errors += 1
+                    error = (
+                        'ValueError: request exceeds the limit of '
+                        f'{_STREAM_LIMIT} bytes'
+                    )
+                    writer.write(json.dumps({'error': error}).encode() + b'\n')
+                    await writer.drain()
+                    break
+                # refuse requests once the server is closed
+                if not line or self._server is None:
+                    break
+                received = time.perf_counter()
+                data = await loop.run_in_executor(
+                    self._executor, self._respond, line
+                )
+                writer.write(data)
+                await writer.drain()
+                with self._lock:
+                    self._latency.append(time.perf_counter() - received)
+        except ConnectionError:
+            pass
+        except asyncio.CancelledError:
+            # end quietly when cancelled by close, since asyncio of
+            # Python 3.12.1 logs cancelled client handlers as errors
+            if self._server is not None:
+                raise
+        finally:
+            self._handlers.discard(task)
+            self._open_connections -= 1
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, asyncio.CancelledError):
+                pass
+
+
+class ReportClient:
+    """Client of :class:`ReportServer`.
+
+    Parameters
+    ----------
+    path : str or path-like, optional
+        The Unix socket path of the server. If not provided, connect to
+        `host` and `port` instead.
+    host : str, optional
+        The loopback address of the server. The default is ``'127.0.0.1'``.
+    port : int, optional
+        The TCP port of the server.
+    timeout : float, optional
+        The socket timeout in seconds. The default is ``None``, i.e., no
+        timeout.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike | None = None,
+        host: str = '127.0.0.1',
+        port: int | None = None,
+        timeout: float | None = None,
+    ):
+        if path is not None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(timeout)
+            try:
+                sock.connect(os.fspath(path))
+            except OSError:
+                sock.close()
+                raise
+        else:
+            if port is None:
+                raise ValueError('port must be provided if path is not')
+            _check_host(host)
+            sock = socket.create_connection((host, port), timeout)
+        self._sock = sock
+        self._file = sock.makefile('rb')
+
+    def request(self, method: str, params: list[dict] | None = None) -> Any:
+        """Send a request and wait for the response.
+
+        Parameters
+        ----------
+        method : str
+            The method name.
+        params : list of dict, optional
+            The batch of keyword arguments.
+
+        Returns
+        -------
+        object
+            The result.
+        """
+        request = {
+            'method': method,
+            'params': [] if params is None else params,
+        }
+        try:
+            self._sock.sendall(json.dumps(request).encode() + b'\n')
+        except (BrokenPipeError, ConnectionResetError):
+            # the server may have rejected the request, read its reply
+            pass
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError('server closed the connection')
+        response = json.loads(line)
+        if 'error' in response:
+            raise ServerError(response['error'])
+        return response['result']
+
+    def round_pdg(self, value: float, err: float, **kwargs) -> str:
+        """Format a value and its error, see :func:`round_pdg`."""
+        return self.request(
+            'round_pdg', [{'value': value, 'err': err, **kwargs}]
+        )[0]
+
+    def round_pdg_batch(self, params: list[dict]) -> list[str]:
+        """Format a batch of values and errors, see :func:`round_pdg`.
+
+        Parameters
+        ----------
+        params : list of dict
+            The keyword arguments of each :func:`round_pdg` call.
+
+        Returns
+        -------
+        list of str
+            The formatted strings.
+        """
+        return self.request('round_pdg', params)
+
+    def summary(self, fmt: str = 'render', **kwargs) -> str | list[str]:
+        """Format a summary, see :meth:`Summary.from_arrays`.
+
+        Parameters
+        ----------
+        fmt : {'render', 'markdown', 'latex'}, optional
+            Whether to return :meth:`Summary.render`, or
+            :meth:`Summary.table` in the given format.
+            The default is ``'render'``.
+        **kwargs
+            The keyword arguments of :meth:`Summary.from_arrays`.
+
+        Returns
+        -------
+        str or list of str
+            The formatted summary.
+        """
+        return self.request('summary', [{'fmt': fmt, **kwargs}])[0]
+
+    def stats(self) -> dict[str, Any]:
+        """Get the server statistics, see :meth:`ReportServer.stats`."""
+        return self.request('stats')
+
+    def close(self) -> None:
+        """Close the connection."""
+        self._file.close()
+        self._sock.close()
+
+    def __enter__(self) -> 'ReportClient':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog='python -m postinfer.report.server',
+        description='Serve postinfer.report formatting on a local socket.',
+    )
+    parser.add_argument('--socket', help='Unix socket path to listen on')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=0)
+    parser.add_argument('--cache-size', type=int, default=65536)
+    args = parser.parse_args(argv)
+
+    async def run():
+        server = ReportServer(
+            args.socket, args.host, args.port, args.cache_size
+        )
+        await server.start()
+        print(f'serving on {server.address}', flush=True)
+        await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,346 @@
+import os
+from collections.abc import Sequence
+
+import numpy as np
+
+from .pdg import _round_pdg_parts, round_pdg
+
+_FIELDS = (
+    'name',
+    'value',
+    'err_lower',
+    'err_upper',
+    'asymmetric',
+    'precision_exp10',
+    'exp10',
+    'rhat',
+    'ess',
+)
+_NUMERIC_DTYPES = [
+    ('value', 'f8'),
+    ('err_lower', 'f8'),
+    ('err_upper', 'f8'),
+    ('asymmetric', '?'),
+    ('precision_exp10', 'i4'),
+    ('exp10', 'i4'),
+    ('rhat', 'f8'),
+    ('ess', 'f8'),
+]
+
+
+def summary_dtype(name_length: int = 1) -> np.dtype:
+    """Get the structured dtype of :class:`Summary` records.
+
+    Parameters
+    ----------
+    name_length : int, optional
+        The maximum number of characters of parameter names.
+        The default is 1.
+
+    Returns
+    -------
+    numpy.dtype
+        The structured dtype.
+    """
+    name_dtype = ('name', f'<U{max(int(name_length), 1)}')
+    return np.dtype([name_dtype] + _NUMERIC_DTYPES)
+
+
+def _fmt_diag(x: float, spec: str) -> str:
+    return '-' if np.isnan(x) else format(x, spec)
+
+
+class Summary:
+    """Columnar summary of parameter estimates.
+
+    The summary is stored in a one-dimensional structured array with the
+    following fields:
+
+    * ``name``: the parameter name,
+    * ``value``: the point estimate,
+    * ``err_lower``: the lower error, non-positive,
+    * ``err_upper``: the upper error, non-negative,
+    * ``asymmetric``: whether the errors are displayed as asymmetric,
+    * ``precision_exp10``: the exponent of last precise digit,
+    * ``exp10``: the exponent to display,
+    * ``rhat``: the R-hat diagnostic, NaN if not available,
+    * ``ess``: the effective sample size, NaN if not available.
+
+    A column is accessed with ``summary['value']``, one at a time. Slicing
+    returns a new :class:`Summary` viewing the same memory, while boolean
+    masks and integer arrays select a compact copy of the rows, following
+    NumPy semantics.
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        The structured array of records, see :func:`summary_dtype`.
+        The array is wrapped without copying.
+    """
+
+    __slots__ = ('_data',)
+
+    def __init__(self, data: np.ndarray):
+        data = np.asarray(data)
+        if data.dtype.names != _FIELDS:
+            raise ValueError(f'fields of data must be {_FIELDS}')
+        if data.ndim != 1:
+            raise ValueError('data must be one-dimensional')
+        self._data = data
+
+    @classmethod
+    def from_arrays(
+        cls,
+        name: Sequence[str],
+        value: Sequence[float],
+        err: Sequence[float],
+        err2: Sequence[float] | None = None,
+        rhat: Sequence[float] | None = None,
+        ess: Sequence[float] | None = None,
+        exp10: int | Sequence[int] | None = None,
+        no_sci_nota_exp10_range: tuple[int, int] = (-1, 2),
+        force_asymmetric: bool = False,
+    ) -> 'Summary':
+        """Create the summary from per-parameter arrays.
+
+        The precision and the display exponent of each parameter are
+        determined by the PDG convention, see :func:`round_pdg`.
+
+        Parameters
+        ----------
+        name : sequence of str
+            The parameter names.
+        value : sequence of float
+            The point estimates.
+        err : sequence of float
+            The errors. If `err2` is provided, `err` is considered as the
+            lower errors and must be non-positive.
+        err2 : sequence of float, optional
+            The upper errors.
+        rhat : sequence of float, optional
+            The R-hat diagnostics.
+        ess : sequence of float, optional
+            The effective sample sizes.
+        exp10 : int or sequence of int, optional
+            The exponents to display. If not provided, they will be
+            determined based on the values and errors.
+        no_sci_nota_exp10_range : tuple of int, optional
+            See :func:`round_pdg`. The default is ``(-1, 2)``.
+        force_asymmetric : bool, optional
+            See :func:`round_pdg`. The default is ``False``.
+
+        Returns
+        -------
+        Summary
+            The summary.
+        """
+        name = [str(i) for i in name]
+        n = len(name)
+        columns = {
+            'value': value,
+            'err': err,
+            'err2': err2,
+            'rhat': rhat,
+            'ess': ess,
+        }
+        for k, v in columns.items():
+            if v is not None and np.shape(v) != (n,):
+                raise ValueError(f'{k} must have the same length as name')
+        data = np.empty(n, dtype=summary_dtype(max(map(len, name), default=1)))
+        data['name'] = name
+        data['value'] = value
+        if err2 is None:
+            data['err_lower'] = np.negative(err)
+            data['err_upper'] = err
+        else:
+            data['err_lower'] = err
+            data['err_upper'] = err2
+        data['rhat'] = np.nan if rhat is None else rhat
+        data['ess'] = np.nan if ess is None else ess
+
+        if exp10 is None or np.ndim(exp10) == 0:
+            exp10 = [exp10] * n
+        elif len(exp10) != n:
+            raise ValueError('exp10 must have the same length as name')
+
+        for i, (v, lo, up) in enumerate(
+            zip(
+                data['value'].tolist(),
+                data['err_lower'].tolist(),
+                data['err_upper'].tolist(),
+                strict=True,
+            )
+        ):
+            # symmetric errors follow the same path as round_pdg(value, err)
+            if err2 is None:
+                lo, up = up, None
+            _, _, up, precision_exp10, exp10_i = _round_pdg_parts(
+                v,
+                lo,
+                up,
+                exp10[i],
+                no_sci_nota_exp10_range,
+                force_asymmetric,
+            )
+            data['asymmetric'][i] = up is not None
+            data['precision_exp10'][i] = precision_exp10
+            data['exp10'][i] = exp10_i
+
+        return cls(data)
+
+    @classmethod
+    def load(
+        cls,
+        file: str | os.PathLike,
+        mmap_mode: str | None = None,
+    ) -> 'Summary':
+        """Load the summary saved by :meth:`save`.
+
+        Parameters
+        ----------
+        file : str or path-like
+            The ``.npy`` or ``.npz`` file.
+        mmap_mode : {None, 'r', 'r+', 'c'}, optional
+            If not ``None``, memory-map the ``.npy`` file instead of reading
+            it into memory, see :func:`numpy.load`. It is ignored for
+            ``.npz`` files. The default is ``None``.
+
+        Returns
+        -------
+        Summary
+            The summary.
+        """
+        loaded = np.load(file, mmap_mode=mmap_mode, allow_pickle=False)
+        if isinstance(loaded, np.lib.npyio.NpzFile):
+            with loaded:
+                data = loaded['summary']
+        else:
+            data = loaded
+        return cls(data)
+
+    def save(self, file: str | os.PathLike, compress: bool = False) -> None:
+        """Save the summary to a ``.npy`` or ``.npz`` file.
+
+        Saving to ``.npy`` allows the summary to be memory-mapped by
+        :meth:`load`.
+
+        Parameters
+        ----------
+        file : str or path-like
+            The file to write. The format is determined by the suffix,
+            which must be ``.npy`` or ``.npz``.
+        compress : bool, optional
+            Whether to compress the ``.npz`` file. The default is ``False``.
+        """
+        suffix = os.path.splitext(os.fspath(file))[1]
+        if suffix == '.npy':
+            np.save(file, self._data, allow_pickle=False)
+        elif suffix == '.npz':
+            savez = np.savez_compressed if compress else np.savez
+            savez(file, summary=self._data)
+        else:
+            raise ValueError(
+                f'file suffix must be .npy or .npz, got {suffix!r}'
+            )
+
+    @property
+    def data(self) -> np.ndarray:
+        """The underlying structured array."""
+        return self._data
+
+    @property
+    def names(self) -> list[str]:
+        """The parameter names."""
+        return self._data['name'].tolist()
+
+    def render(self) -> list[str]:
+        """Format the summary of each parameter in LaTeX.
+
+        Returns
+        -------
+        list of str
+            The formatted strings, see :func:`round_pdg`.
+        """
+        data = self._data
+        return [
+            round_pdg(v, lo, up, exp10=e, force_asymmetric=True)
+            if a
+            else round_pdg(v, 0.5 * (up - lo), exp10=e)
+            for v, lo, up, a, e in zip(
+                data['value'].tolist(),
+                data['err_lower'].tolist(),
+                data['err_upper'].tolist(),
+                data['asymmetric'].tolist(),
+                data['exp10'].tolist(),
+                strict=True,
+            )
+        ]
+
+    def table(self, fmt: str = 'markdown') -> str:
+        """Format the summary as a table.
+
+        Parameters
+        ----------
+        fmt : {'markdown', 'latex'}, optional
+            The table format. The default is ``'markdown'``.
+
+        Returns
+        -------
+        str
+            The formatted table.
+        """
+        if fmt not in ('markdown', 'latex'):
+            raise ValueError(f"fmt must be 'markdown' or 'latex', got {fmt!r}")
+
+        rows = [
+            (n, s, _fmt_diag(r, '.3f'), _fmt_diag(e, '.0f'))
+            for n, s, r, e in zip(
+                self.names,
+                self.render(),
+                self._data['rhat'].tolist(),
+                self._data['ess'].tolist(),
+                strict=True,
+            )
+        ]
+        header = ('Parameter', 'Value', 'R-hat', 'ESS')
+        if fmt == 'markdown':
+            lines = [
+                '| ' + ' | '.join(header) + ' |',
+                '|' + '---|' * len(header),
+            ]
+            lines += ['| ' + ' | '.join(row) + ' |' for row in rows]
+        else:
+            lines = [
+                r'\begin{tabular}{lccc}',
+                r'\hline',
+                ' & '.join(header) + r' \\',
+                r'\hline',
+            ]
+            lines += [' & '.join(row) + r' \\' for row in rows]
+            lines += [r'\hline', r'\end{tabular}']
+        return '\n'.join(lines)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self._data[key]
+        if isinstance(key, (int, np.integer)):
+            key = int(key)
+            if not -len(self) <= key < len(self):
+                raise IndexError('index out of range')
+            key = slice(key, key + 1 if key != -1 else None)
+        elif not isinstance(key, slice):
+            key = np.asarray(key)
+            if key.size == 0:
+                key = key.astype(int)
+            if key.dtype.kind not in 'biu':
+                raise TypeError(
+                    'key must be a column name, an integer, a slice, '
+                    'or a boolean or integer array'
+                )
+        return type(self)(self._data[key])
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.names})'
@@ -0,0 +1,209 @@
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from postinfer.report.pipeline import run_pipeline
+from postinfer.report.summary import Summary
+
+
+def summarize(data):
+    name, value, err = data
+    return Summary.from_arrays([name], [value], [err])
+
+
+class TestRunPipeline:
+    """Test cases for run_pipeline function."""
+
+    def test_output_order(self):
+        """Test the outputs are written in the input order."""
+        sources = [f'p{i}' for i in range(10)]
+        written = []
+        asyncio.run(
+            run_pipeline(
+                sources,
+                load=lambda s: (s, 1.0, 0.1),
+                summarize=summarize,
+                write=lambda s, text: written.append((s, text)),
+            )
+        )
+        assert [s for s, _ in written] == sources
+        assert written[0][1] == summarize(('p0', 1.0, 0.1)).table()
+
+    def test_custom_render_and_executor(self):
+        """Test custom render function and executor."""
+        written = []
+        with ThreadPoolExecutor(2) as executor:
+            asyncio.run(
+                run_pipeline(
+                    range(3),
+                    load=lambda s: (str(s), s, 0.1),
+                    summarize=summarize,
+                    write=lambda s, text: written.append(text),
+                    render=lambda summary: summary.render()[0],
+                    executor=executor,
+                )
+            )
+        assert written == [
+            '$0.00 \\pm 0.10$',
+            '$1.00 \\pm 0.10$',
+            '$2.00 \\pm 0.10$',
+        ]
+
+    def test_process_pool(self):
+        """Test summarizing in a process pool."""
+        written = []
+        with ProcessPoolExecutor(1) as executor:
+            asyncio.run(
+                run_pipeline(
+                    ['a', 'b'],
+                    load=lambda s: (s, 1.0, 0.1),
+                    summarize=summarize,
+                    write=lambda s, text: written.append(text),
+                    executor=executor,
+                )
+            )
+        assert written == [
+            summarize(('a', 1.0, 0.1)).table(),
+            summarize(('b', 1.0, 0.1)).table(),
+        ]
+
+    def test_concurrency(self):
+        """Test summarizing several sources at once in the input order."""
+        barrier = threading.Barrier(3, timeout=5.0)
+
+        def summarize_together(data):
+            # the first source finishes last
+            if data[0] == '0':
+                barrier.wait()
+                threading.Event().wait(0.05)
+            else:
+                barrier.wait()
+            return summarize(data)
+
+        written = []
+        with ThreadPoolExecutor(3) as executor:
+            asyncio.run(
+                run_pipeline(
+                    range(3),
+                    load=lambda s: (str(s), 1.0, 0.1),
+                    summarize=summarize_together,
+                    write=lambda s, text: written.append(s),
+                    executor=executor,
+                    concurrency=3,
+                    maxsize=3,
+                )
+            )
+        assert written == [0, 1, 2]
+
+    def test_sources_iterated_off_loop(self):
+        """Test the sources are iterated outside the event loop thread."""
+        main_thread = threading.current_thread()
+        threads = []
+
+        def sources():
+            for i in range(3):
+                threads.append(threading.current_thread())
+                yield i
+
+        asyncio.run(
+            run_pipeline(
+                sources(),
+                load=lambda s: (str(s), 1.0, 0.1),
+                summarize=summarize,
+                write=lambda s, text: None,
+            )
+        )
+        assert len(threads) == 3
+        assert main_thread not in threads
+
+    def test_overlap(self):
+        """Test the next source is loaded while the current is summarized."""
+        loading = {i: threading.Event() for i in range(3)}
+
+        def load(s):
+            loading[s].set()
+            return (str(s), 1.0, 0.1)
+
+        def summarize_after_next_load(data):
+            s = int(data[0])
+            if s + 1 in loading:
+                assert loading[s + 1].wait(timeout=5.0)
+            return summarize(data)
+
+        asyncio.run(
+            run_pipeline(
+                range(3),
+                load=load,
+                summarize=summarize_after_next_load,
+                write=lambda s, text: None,
+            )
+        )
+
+    def test_backpressure(self):
+        """Test the loading is bounded by the queue size."""
+        counts = {'loaded': 0, 'written': 0, 'ahead': 0}
+        lock = threading.Lock()
+
+        def load(s):
+            with lock:
+                counts['loaded'] += 1
+                ahead = counts['loaded'] - counts['written']
+                counts['ahead'] = max(counts['ahead'], ahead)
+            return (str(s), 1.0, 0.1)
+
+        def write(s, text):
+            threading.Event().wait(0.005)
+            with lock:
+                counts['written'] += 1
+
+        asyncio.run(
+            run_pipeline(
+                range(20), load=load, summarize=summarize, write=write
+            )
+        )
+        assert counts['written'] == 20
+        # queued for and being summarized, queued for and being written,
+        # and being loaded
+        assert counts['ahead'] <= 5
+
+    def test_error_propagation(self):
+        """Test the error in a stage is raised and stops the pipeline."""
+        written = []
+
+        def load(s):
+            if s == 2:
+                raise RuntimeError('cannot read')
+            return (str(s), 1.0, 0.1)
+
+        with pytest.raises(RuntimeError, match='cannot read'):
+            asyncio.run(
+                run_pipeline(
+                    range(100),
+                    load=load,
+                    summarize=summarize,
+                    write=lambda s, text: written.append(s),
+                )
+            )
+        assert len(written) <= 2
+
+        def write(s, text):
+            raise OSError('disk full')
+
+        with pytest.raises(OSError, match='disk full'):
+            asyncio.run(
+                run_pipeline(
+                    range(100),
+                    load=lambda s: (str(s), 1.0, 0.1),
+                    summarize=summarize,
+                    write=write,
+                )
+            )
+
+    def test_invalid_arguments(self):
+        """Test invalid concurrency and queue size."""
+        with pytest.raises(ValueError, match='concurrency'):
+            asyncio.run(run_pipeline([], len, summarize, print, concurrency=0))
+        with pytest.raises(ValueError, match='maxsize'):
+            asyncio.run(run_pipeline([], len, summarize, print, maxsize=0))
@@ -0,0 +1,253 @@
+import asyncio
+import functools
+import os
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from postinfer.report import server as server_module
+from postinfer.report.pdg import round_pdg
+from postinfer.report.server import ReportClient, ReportServer, ServerError
+from postinfer.report.summary import Summary
+
+
+@pytest.fixture
+def running():
+    """Run servers in a background event loop."""
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    servers = []
+
+    def start(server):
+        asyncio.run_coroutine_threadsafe(server.start(), loop).result()
+        servers.append(server)
+        return server
+
+    yield start
+
+    for server in servers:
+        asyncio.run_coroutine_threadsafe(server.close(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+@pytest.fixture
+def sock_path():
+    """Unix socket path short enough for the 104 bytes limit of macOS."""
+    tmpdir = tempfile.mkdtemp(dir='/tmp')
+    yield os.path.join(tmpdir, 'report.sock')
+    shutil.rmtree(tmpdir)
+
+
+@pytest.fixture
+def server(running, sock_path):
+    return running(ReportServer(sock_path))
+
+
+class TestReportServer:
+    """Test cases for ReportServer and ReportClient."""
+
+    def test_round_pdg(self, server):
+        """Test formatting single and batched values."""
+        with ReportClient(server.address) as client:
+            assert client.round_pdg(1.234, 0.056) == round_pdg(1.234, 0.056)
+            assert client.round_pdg(
+                1.234, -0.056, err2=0.078, exp10=-1
+            ) == round_pdg(1.234, -0.056, 0.078, exp10=-1)
+            params = [{'value': i, 'err': 0.1 * (i + 1)} for i in range(5)]
+            assert client.round_pdg_batch(params) == [
+                round_pdg(**p) for p in params
+            ]
+
+    def test_summary(self, server):
+        """Test formatting summaries."""
+        kwargs = {'name': ['a', 'b'], 'value': [1.0, 2.0], 'err': [0.1, 0.2]}
+        summary = Summary.from_arrays(**kwargs)
+        with ReportClient(server.address) as client:
+            assert client.summary(**kwargs) == summary.render()
+            assert client.summary('latex', **kwargs) == summary.table('latex')
+
+    def test_cache_and_stats(self, server):
+        """Test repeated requests hit the cache and statistics."""
+        with ReportClient(server.address) as client:
+            for _ in range(3):
+                client.round_pdg(1.234, 0.056)
+            stats = client.stats()
+        assert stats['requests'] == 3
+        assert stats['items'] == 3
+        assert stats['errors'] == 0
+        assert stats['open_connections'] == 1
+        assert stats['total_connections'] == 1
+        assert stats['cache']['round_pdg'] == {
+            'hits': 2,
+            'misses': 1,
+            'size': 1,
+        }
+        assert stats['latency']['p50'] <= stats['latency']['max']
+        assert stats['items_per_second'] > 0
+
+    def test_cache_key_types(self, server):
+        """Test values comparing equal but of different types are apart."""
+        kwargs = {'value': [1.0], 'err': [0.1], 'fmt': 'markdown'}
+        with ReportClient(server.address) as client:
+            tables = [
+                client.summary(name=[name], **kwargs)
+                for name in (1, 1.0, True)
+            ]
+        assert [t.splitlines()[-1].split(' | ')[0] for t in tables] == [
+            '| 1',
+            '| 1.0',
+            '| True',
+        ]
+
+    def test_errors(self, server):
+        """Test errors are reported to the client."""
+        with ReportClient(server.address) as client:
+            with pytest.raises(ServerError, match='error must be positive'):
+                client.round_pdg(1.0, -0.1)
+            with pytest.raises(ServerError, match='unknown method'):
+                client.request('foo')
+            with pytest.raises(ServerError, match='list of JSON objects'):
+                client.request('round_pdg', [1.0])
+            # the connection is still usable
+            assert client.round_pdg(1.0, 0.1) == round_pdg(1.0, 0.1)
+        assert server.stats()['errors'] == 3
+
+    def test_request_too_long(self, monkeypatch, sock_path):
+        """Test the client gets an error for a request over the limit."""
+        monkeypatch.setattr(server_module, '_STREAM_LIMIT', 1024)
+
+        async def run():
+            server = ReportServer(sock_path)
+            await server.start()
+
+            def request():
+                with ReportClient(sock_path, timeout=5.0) as client:
+                    with pytest.raises(ServerError, match='exceeds the limit'):
+                        client.round_pdg_batch([{'value': 1.0}] * 1000)
+
+            try:
+                await asyncio.get_running_loop().run_in_executor(None, request)
+            finally:
+                await server.close()
+            assert server.stats()['errors'] == 1
+
+        asyncio.run(run())
+
+    def test_close_with_connected_client(self, sock_path):
+        """Test closing the server while a client is still connected."""
+
+        async def run():
+            server = ReportServer(sock_path)
+            await server.start()
+            serving = asyncio.ensure_future(server.serve_forever())
+            loop = asyncio.get_running_loop()
+            client = await loop.run_in_executor(
+                None, functools.partial(ReportClient, sock_path, timeout=5.0)
+            )
+            try:
+                result = await loop.run_in_executor(
+                    None, client.round_pdg, 1.0, 0.1
+                )
+                assert result == round_pdg(1.0, 0.1)
+                # the client is idle but still connected
+                serving.cancel()
+                await asyncio.wait_for(
+                    asyncio.gather(serving, return_exceptions=True), 3.0
+                )
+                assert server.stats()['open_connections'] == 0
+                with pytest.raises(ConnectionError):
+                    await loop.run_in_executor(
+                        None, client.round_pdg, 1.0, 0.1
+                    )
+            finally:
+                client.close()
+            assert not os.path.exists(sock_path)
+
+        asyncio.run(run())
+
+    def test_concurrent_clients(self, server):
+        """Test serving concurrent clients."""
+
+        def work(i):
+            with ReportClient(server.address) as client:
+                return [client.round_pdg(i, 0.1 * j) for j in range(1, 20)]
+
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(work, range(16)))
+        assert results == [
+            [round_pdg(i, 0.1 * j) for j in range(1, 20)] for i in range(16)
+        ]
+        assert server.stats()['requests'] == 16 * 19
+
+    def test_slow_request(self, server):
+        """Test a slow request neither blocks the loop nor hides the wait."""
+        release = threading.Event()
+
+        def slow(kwargs):
+            release.wait(timeout=5.0)
+            return 'slow'
+
+        server._methods['round_pdg'] = functools.lru_cache(16)(slow)
+
+        def request(params):
+            with ReportClient(server.address) as client:
+                return client.round_pdg_batch(params)
+
+        with ThreadPoolExecutor(2) as executor:
+            slow_result = executor.submit(request, [{}])
+            fast_result = executor.submit(request, [{'value': 1, 'err': 1}])
+            # the loop still accepts the second client during the slow batch
+            deadline = time.monotonic() + 5.0
+            while server.stats()['open_connections'] < 2:
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+            time.sleep(0.2)
+            release.set()
+            assert slow_result.result() == ['slow']
+            assert fast_result.result() == ['slow']
+
+        stats = server.stats()
+        assert stats['total_connections'] == 2
+        # the fast request waited behind the slow one
+        assert stats['latency']['p50'] >= 0.1
+        assert stats['service_time']['p50'] < 0.1
+
+    def test_tcp(self, running):
+        """Test serving on the loopback address."""
+        server = running(ReportServer(port=0))
+        host, port = server.address
+        with ReportClient(host=host, port=port) as client:
+            assert client.round_pdg(1.0, 0.1) == round_pdg(1.0, 0.1)
+
+    def test_loopback_only(self):
+        """Test non-loopback addresses are rejected."""
+        with pytest.raises(ValueError, match='loopback'):
+            ReportServer(host='0.0.0.0')
+        with pytest.raises(ValueError, match='loopback'):
+            ReportClient(host='example.com', port=1)
+        with pytest.raises(ValueError, match='port'):
+            ReportClient()
+
+    def test_socket_removed_on_close(self, sock_path):
+        """Test the Unix socket file is removed when the server closes."""
+        path = sock_path
+
+        async def run():
+            server = ReportServer(path)
+            await server.start()
+            assert os.path.exists(path)
+            with pytest.raises(RuntimeError, match='already started'):
+                await server.start()
+            await server.close()
+
+        asyncio.run(run())
+        assert not os.path.exists(path)
+        with pytest.raises(RuntimeError, match='not started'):
+            _ = ReportServer(path).address
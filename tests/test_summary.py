@@ -0,0 +1,178 @@
+import numpy as np
+import pytest
+
+from postinfer.report.pdg import round_pdg
+from postinfer.report.summary import Summary, summary_dtype
+
+
+@pytest.fixture
+def summary():
+    return Summary.from_arrays(
+        name=['a', 'bb', 'ccc'],
+        value=[1.234, 1234.5, 0.001234],
+        err=[-0.056, -56.7, -0.000056],
+        err2=[0.078, 56.7, 0.000056],
+        rhat=[1.001, 1.2, 1.0],
+        ess=[1000.0, 50.0, 4000.0],
+    )
+
+
+class TestFromArrays:
+    """Test cases for Summary.from_arrays."""
+
+    def test_fields(self, summary):
+        """Test the stored columns."""
+        assert len(summary) == 3
+        assert summary.names == ['a', 'bb', 'ccc']
+        assert summary.data.dtype == summary_dtype(3)
+        assert summary['asymmetric'].tolist() == [True, False, False]
+        assert summary['exp10'].tolist() == [0, 3, -3]
+        assert summary['precision_exp10'].tolist() == [-2, 1, -5]
+
+    def test_symmetric_errors(self):
+        """Test symmetric errors are stored as lower and upper errors."""
+        s = Summary.from_arrays(['x'], [1.0], [0.1])
+        assert s['err_lower'].tolist() == [-0.1]
+        assert s['err_upper'].tolist() == [0.1]
+        assert np.isnan(s['rhat']).all()
+        assert np.isnan(s['ess']).all()
+
+    def test_symmetric_force_asymmetric(self):
+        """Test symmetric errors are not displayed as asymmetric."""
+        s = Summary.from_arrays(['x'], [1.0], [0.1], force_asymmetric=True)
+        assert s['asymmetric'].tolist() == [False]
+        assert s.render() == [round_pdg(1.0, 0.1, force_asymmetric=True)]
+
+    def test_negative_symmetric_error(self):
+        """Test negative symmetric errors are rejected as in round_pdg."""
+        with pytest.raises(ValueError, match='^error must be positive'):
+            Summary.from_arrays(['x'], [1.0], [-0.1])
+
+    def test_exp10(self):
+        """Test the display exponent provided by user."""
+        s = Summary.from_arrays(['x', 'y'], [1.0, 2.0], [0.1, 0.2], exp10=-1)
+        assert s['exp10'].tolist() == [-1, -1]
+        with pytest.raises(ValueError, match='same length'):
+            Summary.from_arrays(['x'], [1.0], [0.1], exp10=[0, 1])
+
+    def test_column_length(self):
+        """Test columns of wrong length are rejected instead of broadcast."""
+        with pytest.raises(ValueError, match='value must have the same'):
+            Summary.from_arrays(['a', 'b', 'c'], [1.0], [0.1, 0.1, 0.1])
+        with pytest.raises(ValueError, match='err must have the same'):
+            Summary.from_arrays(['a', 'b', 'c'], [1.0, 2.0, 3.0], [0.1])
+        with pytest.raises(ValueError, match='err2 must have the same'):
+            Summary.from_arrays(['a', 'b'], [1.0, 2.0], [-0.1, -0.1], [0.1])
+        with pytest.raises(ValueError, match='rhat must have the same'):
+            Summary.from_arrays(['a', 'b'], [1.0, 2.0], [0.1, 0.1], rhat=1.0)
+        with pytest.raises(ValueError, match='ess must have the same'):
+            Summary.from_arrays(
+                ['a', 'b'], [1.0, 2.0], [0.1, 0.1], ess=[1.0, 2.0, 3.0]
+            )
+
+    def test_invalid_data(self):
+        """Test invalid structured array."""
+        with pytest.raises(ValueError, match='fields'):
+            Summary(np.zeros(3))
+        with pytest.raises(ValueError, match='one-dimensional'):
+            Summary(np.zeros((1, 2), dtype=summary_dtype()))
+
+
+class TestRender:
+    """Test cases for rendering the summary."""
+
+    def test_render(self, summary):
+        """Test rendering matches round_pdg."""
+        assert summary.render() == [
+            round_pdg(1.234, -0.056, 0.078),
+            round_pdg(1234.5, -56.7, 56.7),
+            round_pdg(0.001234, -0.000056, 0.000056),
+        ]
+
+    def test_render_force_asymmetric(self):
+        """Test rendering with forced asymmetric errors."""
+        s = Summary.from_arrays(
+            ['x'], [1.0], [-0.1], [0.101], force_asymmetric=True
+        )
+        assert s.render() == [
+            round_pdg(1.0, -0.1, 0.101, force_asymmetric=True)
+        ]
+
+    def test_table(self, summary):
+        """Test formatting the summary as tables."""
+        markdown = summary.table()
+        assert (
+            markdown.splitlines()[0] == '| Parameter | Value | R-hat | ESS |'
+        )
+        assert '| bb |' in markdown and '1.200' in markdown
+        latex = summary.table('latex')
+        assert latex.startswith(r'\begin{tabular}')
+        assert latex.endswith(r'\end{tabular}')
+        s = Summary.from_arrays(['x'], [1.0], [0.1])
+        assert s.table().splitlines()[-1].endswith('| - | - |')
+        with pytest.raises(ValueError, match='fmt'):
+            summary.table('html')
+
+
+class TestSelection:
+    """Test cases for slicing and selecting the summary."""
+
+    def test_slice_is_view(self, summary):
+        """Test slicing does not copy the data."""
+        sub = summary[1:]
+        assert sub.names == ['bb', 'ccc']
+        assert np.shares_memory(sub.data, summary.data)
+        sub['value'][0] = 0.0
+        assert summary['value'][1] == 0.0
+
+    def test_integer_index(self, summary):
+        """Test integer index returns a single-row summary."""
+        assert summary[0].names == ['a']
+        assert summary[-1].names == ['ccc']
+        assert np.shares_memory(summary[-1].data, summary.data)
+        with pytest.raises(IndexError):
+            summary[3]
+
+    def test_invalid_key(self, summary):
+        """Test keys other than a column name or row indices."""
+        with pytest.raises(TypeError, match='column name'):
+            summary[['value', 'rhat']]
+        with pytest.raises(TypeError, match='column name'):
+            summary[[0.5]]
+        assert len(summary[[]]) == 0
+        assert summary[[2, 0]].names == ['ccc', 'a']
+
+    def test_boolean_mask(self, summary):
+        """Test boolean selection."""
+        sub = summary[summary['rhat'] < 1.01]
+        assert sub.names == ['a', 'ccc']
+        assert sub.render() == [summary.render()[0], summary.render()[2]]
+
+
+class TestIO:
+    """Test cases for saving and loading the summary."""
+
+    @pytest.mark.parametrize('suffix', ['.npy', '.npz'])
+    @pytest.mark.parametrize('compress', [False, True])
+    def test_roundtrip(self, summary, tmp_path, suffix, compress):
+        """Test saving and loading the summary."""
+        file = tmp_path / f'summary{suffix}'
+        summary.save(file, compress=compress)
+        loaded = Summary.load(file)
+        assert np.array_equal(loaded.data, summary.data)
+        assert loaded.render() == summary.render()
+
+    def test_mmap(self, summary, tmp_path):
+        """Test memory-mapping the summary."""
+        file = tmp_path / 'summary.npy'
+        summary.save(file)
+        loaded = Summary.load(file, mmap_mode='r')
+        assert isinstance(loaded.data.base, np.memmap) or isinstance(
+            loaded.data, np.memmap
+        )
+        assert loaded[:2].names == ['a', 'bb']
+
+    def test_invalid_suffix(self, summary, tmp_path):
+        """Test saving to unsupported format."""
+        with pytest.raises(ValueError, match='suffix'):
+            summary.save(tmp_path / 'summary.txt')